@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+from dataclasses import dataclass, field
+import logging
 from typing import cast
 
 from aiohttp import ClientResponseError
@@ -12,18 +15,32 @@ from yalexs.manager.gateway import Config as YaleXSConfig
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers import device_registry as dr
+from homeassistant.util.hass_dict import HassKey
 
 from .const import DOMAIN, PLATFORMS
 from .data import AugustData
 from .gateway import AugustGateway
 from .util import async_create_august_clientsession
 
+_LOGGER = logging.getLogger(__name__)
+
 type AugustConfigEntry = ConfigEntry[AugustData]
 
 
+@dataclass(slots=True)
+class _AugustRunning:
+    """Running august data objects and their shared shutdown listener."""
+
+    unsub_stop: CALLBACK_TYPE
+    data: set[AugustData] = field(default_factory=set)
+
+
+DATA_AUGUST_RUNNING: HassKey[_AugustRunning] = HassKey(f"{DOMAIN}_running")
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up August from a config entry."""
     session = async_create_august_clientsession(hass)
@@ -47,38 +64,78 @@ async def async_setup_august(
     hass: HomeAssistant, entry: AugustConfigEntry, august_gateway: AugustGateway
 ) -> bool:
     """Set up the August component."""
-    config = cast(YaleXSConfig, entry.data)
+    entry_data = entry.data
+    config = cast(YaleXSConfig, entry_data)
     await august_gateway.async_setup(config)
 
-    if CONF_PASSWORD in entry.data:
+    if CONF_PASSWORD in entry_data:
         # We no longer need to store passwords since we do not
         # support YAML anymore
-        config_data = entry.data.copy()
-        del config_data[CONF_PASSWORD]
+        config_data = {k: v for k, v in entry_data.items() if k != CONF_PASSWORD}
         hass.config_entries.async_update_entry(entry, data=config_data)
 
     await august_gateway.async_authenticate()
     await august_gateway.async_refresh_access_token_if_needed()
 
     data = entry.runtime_data = AugustData(hass, entry, august_gateway)
-    entry.async_on_unload(
-        hass.bus.async_listen(EVENT_HOMEASSISTANT_STOP, data.async_stop)
-    )
+    _async_stop_at_shutdown(hass, entry, data)
     entry.async_on_unload(data.async_stop)
     await data.async_setup()
 
+    # The platforms build their entities from the locks and doorbells
+    # loaded by data.async_setup so they cannot be forwarded concurrently
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
 
 
+@callback
+def _async_stop_at_shutdown(
+    hass: HomeAssistant, entry: AugustConfigEntry, data: AugustData
+) -> None:
+    """Stop the data object when Home Assistant shuts down.
+
+    A single listener is shared by all august config entries and is
+    removed again once the last entry is unloaded.
+    """
+    if (running := hass.data.get(DATA_AUGUST_RUNNING)) is None:
+
+        async def _async_stop_all(event: Event) -> None:
+            """Stop all running august data objects."""
+            # The listener only fires once so forget it before stopping
+            stopping = hass.data.pop(DATA_AUGUST_RUNNING).data
+            results = await asyncio.gather(
+                *(august_data.async_stop() for august_data in stopping),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    _LOGGER.error("Error stopping august", exc_info=result)
+
+        running = hass.data[DATA_AUGUST_RUNNING] = _AugustRunning(
+            hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop_all)
+        )
+
+    running.data.add(data)
+
+    @callback
+    def _async_remove_running() -> None:
+        """Stop tracking the data object and drop the listener when unused."""
+        running.data.discard(data)
+        if not running.data and hass.data.get(DATA_AUGUST_RUNNING) is running:
+            del hass.data[DATA_AUGUST_RUNNING]
+            running.unsub_stop()
+
+    entry.async_on_unload(_async_remove_running)
+
+
 async def async_remove_config_entry_device(
     hass: HomeAssistant, config_entry: AugustConfigEntry, device_entry: dr.DeviceEntry
 ) -> bool:
     """Remove august config entry from a device if its no longer present."""
+    get_device = config_entry.runtime_data.get_device
     return not any(
-        identifier
+        get_device(identifier[1])
         for identifier in device_entry.identifiers
         if identifier[0] == DOMAIN
-        and config_entry.runtime_data.get_device(identifier[1])
     )
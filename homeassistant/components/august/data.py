@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from yalexs.const import DEFAULT_BRAND
 from yalexs.lock import LockDetail
 from yalexs.manager.const import CONF_BRAND
@@ -52,8 +54,20 @@ class AugustData(YaleXSData):
         """Init August data object."""
         self._hass = hass
         self._config_entry = config_entry
+        self._stopped = False
         super().__init__(august_gateway, HomeAssistantError)
 
+    async def async_stop(self, *args: Any) -> None:
+        """Stop the subscriptions.
+
+        This is called both when Home Assistant stops and when the
+        config entry is unloaded but only the first call does the work.
+        """
+        if self._stopped:
+            return
+        self._stopped = True
+        await super().async_stop(*args)
+
     @property
     def brand(self) -> str:
         """Brand of the device."""
@@ -1,17 +1,19 @@
 """The tests for the august platform."""
 
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 from aiohttp import ClientResponseError
 import pytest
 from yalexs.authenticator_common import AuthenticationState
 from yalexs.exceptions import AugustApiAIOHTTPError
+from yalexs.manager.data import YaleXSData
 
 from homeassistant.components.august.const import DOMAIN
 from homeassistant.components.lock import DOMAIN as LOCK_DOMAIN
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import (
     ATTR_ENTITY_ID,
+    EVENT_HOMEASSISTANT_STOP,
     SERVICE_LOCK,
     SERVICE_OPEN,
     SERVICE_UNLOCK,
@@ -24,8 +26,10 @@ from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.setup import async_setup_component
 
 from .mocks import (
+    _create_august_api_with_devices,
     _create_august_with_devices,
     _mock_august_authentication,
+    _mock_doorbell_from_fixture,
     _mock_doorsense_enabled_august_lock_detail,
     _mock_doorsense_missing_august_lock_detail,
     _mock_get_config,
@@ -373,6 +377,88 @@ async def test_load_unload(hass: HomeAssistant) -> None:
     await hass.async_block_till_done()
 
 
+async def test_reload_keeps_session_open(hass: HomeAssistant) -> None:
+    """Test the august session can still be used after the entry is reloaded."""
+    august_operative_lock = await _mock_operative_august_lock_detail(hass)
+    config_entry, api_instance = await _create_august_api_with_devices(
+        hass, [august_operative_lock]
+    )
+
+    with (
+        patch("yalexs.manager.gateway.ApiAsync", return_value=api_instance) as api_mock,
+        patch(
+            "yalexs.manager.gateway.AuthenticatorAsync.async_authenticate",
+            return_value=_mock_august_authentication(
+                "original_token", 1234, AuthenticationState.AUTHENTICATED
+            ),
+        ),
+        patch("yalexs.manager.data.async_create_pubnub", return_value=AsyncMock()),
+    ):
+        assert await hass.config_entries.async_reload(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert config_entry.state is ConfigEntryState.LOADED
+    session = api_mock.call_args.args[0]
+    assert not session.closed
+
+    data = {ATTR_ENTITY_ID: "lock.a6697750d607098bae8d6baa11ef8063_name"}
+    await hass.services.async_call(LOCK_DOMAIN, SERVICE_UNLOCK, data, blocking=True)
+    assert api_instance.async_unlock_return_activities.mock_calls
+
+
+async def test_stop_stops_all_entries(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test every entry is stopped at shutdown even if one of them fails."""
+    august_operative_lock = await _mock_operative_august_lock_detail(hass)
+    doorbell_one = await _mock_doorbell_from_fixture(hass, "get_doorbell.json")
+    await _create_august_with_devices(hass, [august_operative_lock])
+    await _create_august_with_devices(hass, [doorbell_one])
+
+    with patch.object(
+        YaleXSData, "async_stop", autospec=True, side_effect=[AttributeError, None]
+    ) as mock_stop:
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+        await hass.async_block_till_done()
+
+    assert len(mock_stop.mock_calls) == 2
+    assert "Error stopping august" in caplog.text
+
+
+async def test_unloaded_entry_is_not_stopped_at_shutdown(hass: HomeAssistant) -> None:
+    """Test an unloaded entry is no longer stopped when Home Assistant stops."""
+    august_operative_lock = await _mock_operative_august_lock_detail(hass)
+    config_entry = await _create_august_with_devices(hass, [august_operative_lock])
+    stop_listeners = hass.bus.async_listeners()[EVENT_HOMEASSISTANT_STOP]
+
+    with patch.object(YaleXSData, "async_stop", autospec=True) as mock_stop:
+        await hass.config_entries.async_unload(config_entry.entry_id)
+        await hass.async_block_till_done()
+        assert (
+            hass.bus.async_listeners().get(EVENT_HOMEASSISTANT_STOP, 0)
+            == stop_listeners - 1
+        )
+
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+        await hass.async_block_till_done()
+
+    assert len(mock_stop.mock_calls) == 1
+
+
+async def test_stop_then_unload_stops_once(hass: HomeAssistant) -> None:
+    """Test the library stop only runs once when stopping and then unloading."""
+    august_operative_lock = await _mock_operative_august_lock_detail(hass)
+    config_entry = await _create_august_with_devices(hass, [august_operative_lock])
+
+    with patch.object(YaleXSData, "async_stop", autospec=True) as mock_stop:
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+        await hass.async_block_till_done()
+        await hass.config_entries.async_unload(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert len(mock_stop.mock_calls) == 1
+
+
 async def test_load_triggers_ble_discovery(
     hass: HomeAssistant, mock_discovery: Mock
 ) -> None:
@@ -137,15 +137,12 @@ def find_entity_id(domain, zha_device, hass, qualifier=None):
     This is used to get the entity id in order to get the state from the state
     machine so that we can test state changes.
     """
-    entities = find_entity_ids(domain, zha_device, hass)
-    if not entities:
-        return None
+    entity_ids = _iter_entity_ids(domain, zha_device, hass)
     if qualifier:
-        for entity_id in entities:
-            if qualifier in entity_id:
-                return entity_id
-    else:
-        return entities[0]
+        return next(
+            (entity_id for entity_id in entity_ids if qualifier in entity_id), None
+        )
+    return next(entity_ids, None)
 
 
 def find_entity_ids(domain, zha_device, hass):
@@ -154,13 +151,17 @@ def find_entity_ids(domain, zha_device, hass):
     This is used to get the entity id in order to get the state from the state
     machine so that we can test state changes.
     """
+    return list(_iter_entity_ids(domain, zha_device, hass))
+
 
+def _iter_entity_ids(domain, zha_device, hass):
+    """Iterate the registered entity ids of a ZHA device for a domain."""
     registry = er.async_get(hass)
-    return [
+    return (
         entity.entity_id
         for entity in er.async_entries_for_device(registry, zha_device.device_id)
         if entity.domain == domain
-    ]
+    )
 
 
 def async_find_group_entity_id(hass, domain, group):
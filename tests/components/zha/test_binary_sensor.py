@@ -1,6 +1,9 @@
 """Test ZHA binary sensor."""
 
+import asyncio
 from collections.abc import Callable
+from contextlib import suppress
+from types import MappingProxyType
 from typing import Any
 from unittest.mock import patch
 
@@ -21,37 +24,39 @@ from .conftest import SIG_EP_INPUT, SIG_EP_OUTPUT, SIG_EP_PROFILE, SIG_EP_TYPE
 
 from tests.common import async_mock_load_restore_state_from_storage
 
-DEVICE_IAS = {
-    1: {
-        SIG_EP_PROFILE: zigpy.profiles.zha.PROFILE_ID,
-        SIG_EP_TYPE: zigpy.profiles.zha.DeviceType.IAS_ZONE,
-        SIG_EP_INPUT: [security.IasZone.cluster_id],
-        SIG_EP_OUTPUT: [],
-    }
-}
-
-
-DEVICE_OCCUPANCY = {
-    1: {
-        SIG_EP_PROFILE: zigpy.profiles.zha.PROFILE_ID,
-        SIG_EP_TYPE: zigpy.profiles.zha.DeviceType.OCCUPANCY_SENSOR,
-        SIG_EP_INPUT: [measurement.OccupancySensing.cluster_id],
-        SIG_EP_OUTPUT: [],
-    }
-}
-
-
-DEVICE_ONOFF = {
-    1: {
-        SIG_EP_PROFILE: zigpy.profiles.zha.PROFILE_ID,
-        SIG_EP_TYPE: zigpy.profiles.zha.DeviceType.ON_OFF_SENSOR,
-        SIG_EP_INPUT: [],
-        SIG_EP_OUTPUT: [general.OnOff.cluster_id],
-    }
-}
-
-
-@pytest.fixture(autouse=True)
+
+def _ep(dev_type, inputs=(), outputs=()):
+    """Return a frozen single endpoint device signature."""
+    return MappingProxyType(
+        {
+            1: MappingProxyType(
+                {
+                    SIG_EP_PROFILE: zigpy.profiles.zha.PROFILE_ID,
+                    SIG_EP_TYPE: dev_type,
+                    SIG_EP_INPUT: inputs,
+                    SIG_EP_OUTPUT: outputs,
+                }
+            )
+        }
+    )
+
+
+DEVICE_IAS = _ep(
+    zigpy.profiles.zha.DeviceType.IAS_ZONE, inputs=(security.IasZone.cluster_id,)
+)
+DEVICE_OCCUPANCY = _ep(
+    zigpy.profiles.zha.DeviceType.OCCUPANCY_SENSOR,
+    inputs=(measurement.OccupancySensing.cluster_id,),
+)
+DEVICE_ONOFF = _ep(
+    zigpy.profiles.zha.DeviceType.ON_OFF_SENSOR, outputs=(general.OnOff.cluster_id,)
+)
+
+_ATTRS_ON = {1: 0, 0: 1, 2: 2}
+_ATTRS_OFF = {1: 1, 0: 0, 2: 2}
+
+
+@pytest.fixture(scope="module", autouse=True)
 def binary_sensor_platform_only():
     """Only set up the binary_sensor and required base platforms to speed up tests."""
     with patch(
@@ -69,27 +74,39 @@ def binary_sensor_platform_only():
 async def async_test_binary_sensor_on_off(hass, cluster, entity_id):
     """Test getting on and off messages for binary sensors."""
     # binary sensor on
-    await send_attributes_report(hass, cluster, {1: 0, 0: 1, 2: 2})
+    await send_attributes_report(hass, cluster, _ATTRS_ON)
     assert hass.states.get(entity_id).state == STATE_ON
 
     # binary sensor off
-    await send_attributes_report(hass, cluster, {1: 1, 0: 0, 2: 2})
+    await send_attributes_report(hass, cluster, _ATTRS_OFF)
     assert hass.states.get(entity_id).state == STATE_OFF
 
 
+async def _async_until_state(hass, entity_id, state, timeout=1.0):
+    """Yield to the event loop until the entity reaches the expected state."""
+    with suppress(TimeoutError):
+        async with asyncio.timeout(timeout):
+            while (
+                current := hass.states.get(entity_id)
+            ) is None or current.state != state:
+                await asyncio.sleep(0)
+    current = hass.states.get(entity_id)
+    assert current is not None
+    assert current.state == state
+
+
 async def async_test_iaszone_on_off(hass, cluster, entity_id):
     """Test getting on and off messages for iaszone binary sensors."""
     # binary sensor on
     cluster.listener_event("cluster_command", 1, 0, [1])
-    await hass.async_block_till_done()
-    assert hass.states.get(entity_id).state == STATE_ON
+    await _async_until_state(hass, entity_id, STATE_ON)
 
     # binary sensor off
     cluster.listener_event("cluster_command", 1, 0, [0])
-    await hass.async_block_till_done()
-    assert hass.states.get(entity_id).state == STATE_OFF
+    await _async_until_state(hass, entity_id, STATE_OFF)
 
     # check that binary sensor remains off when non-alarm bits change
+    # (polling cannot prove the state did not change, so drain the loop)
     cluster.listener_event("cluster_command", 1, 0, [0b1111111100])
     await hass.async_block_till_done()
     assert hass.states.get(entity_id).state == STATE_OFF